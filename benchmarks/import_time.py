@@ -0,0 +1,53 @@
+"""Measure how long importing the scraper package takes in a fresh interpreter.
+
+Usage: python benchmarks/import_time.py [module ...] [--runs N]
+
+Each run starts a new interpreter, imports the module and reports the wall
+time, plus any heavy dependency that got pulled in eagerly.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+HEAVY_MODULES = ("yt_dlp", "selenium", "webdriver_manager", "aiohttp", "dateutil", "psutil")
+DEFAULT_MODULES = ("youtube_scraper", "youtube_scraper.cli", "youtube_scraper.scraper")
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = """
+import sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+heavy = [name for name in {heavy!r} if name in sys.modules]
+print(elapsed, ",".join(heavy))
+"""
+
+def time_import(module, runs):
+    """Import module in runs fresh interpreters, returning timings and eager heavy imports."""
+    timings, heavy = [], set()
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", PROBE.format(module=module, heavy=HEAVY_MODULES)],
+            cwd=REPO_ROOT, capture_output=True, text=True, check=True
+        ).stdout.split()
+        timings.append(float(output[0]))
+        if len(output) > 1:
+            heavy.update(output[1].split(","))
+    return timings, heavy
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES)
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    for module in args.modules:
+        timings, heavy = time_import(module, args.runs)
+        print(f"{module}: median {statistics.median(timings) * 1000:.1f} ms, "
+              f"min {min(timings) * 1000:.1f} ms over {args.runs} runs"
+              f"{' | eager: ' + ', '.join(sorted(heavy)) if heavy else ''}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Exercise the memory governor with a fake extractor that returns oversized payloads.
+
+Usage: python benchmarks/memory_governor.py [--videos N] [--comments N] [--budget MB]
+
+Runs scrape_videos_shorts against an in-process stand-in for yt_dlp (no
+network), once without and once with a memory budget, each in a fresh
+interpreter, and prints peak RSS, peak concurrency, pauses and the governor's
+final concurrency limit. tests/test_governor.py checks the same behaviour
+with a fake RSS.
+"""
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import types
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+def fake_yt_dlp(videos, comments, delay):
+    """Build a yt_dlp stand-in whose per-video info carries a huge comment list."""
+    class YoutubeDL:
+        def __init__(self, opts):
+            pass
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def extract_info(self, url, download=False):
+            if url.endswith(("/videos", "/shorts")):
+                return {"entries": [{"id": f"v{i}", "url": f"https://example.invalid/v{i}"} for i in range(videos)]}
+            time.sleep(delay)
+            video_id = url.rsplit("/", 1)[1]
+            return {
+                "id": video_id,
+                "title": f"Video {video_id}",
+                "upload_date": "20240101",
+                "view_count": 1,
+                "comments": [
+                    {"id": f"{video_id}-c{i}", "text": "x" * 2000, "timestamp": 1700000000}
+                    for i in range(comments)
+                ],
+            }
+    return types.SimpleNamespace(YoutubeDL=YoutubeDL)
+
+async def sample_peak_rss(peak, interval=0.01):
+    """Record the highest RSS seen until cancelled."""
+    from youtube_scraper.utils import memory_usage_mb
+    while True:
+        peak[0] = max(peak[0], memory_usage_mb())
+        await asyncio.sleep(interval)
+
+async def run_once(budget_mb):
+    from youtube_scraper import scraper
+    from youtube_scraper.governor import MemoryGovernor
+
+    governor = MemoryGovernor(10, budget_mb)
+    peak = [0.0]
+    sampler = asyncio.ensure_future(sample_peak_rss(peak))
+    start = time.perf_counter()
+    data, _ = await scraper.scrape_videos_shorts(
+        "https://example.invalid/@channel", "videos", None, "channel", governor=governor
+    )
+    elapsed = time.perf_counter() - start
+    sampler.cancel()
+    return elapsed, len(data["videos"]), peak[0], governor
+
+def child(args):
+    """Run one configuration in this interpreter and print a summary line."""
+    from youtube_scraper import config, db
+
+    sys.modules["yt_dlp"] = fake_yt_dlp(args.videos, args.comments, args.delay)
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        config.DATABASE_NAME = os.path.join(workdir, "bench.db")
+        db.init_database()
+        elapsed, saved, peak_rss, governor = asyncio.run(run_once(args.budget))
+    label = f"budget {args.budget:.0f} MB" if args.budget else "no budget"
+    print(f"{label}: {saved} videos in {elapsed:.2f}s, peak RSS {peak_rss:.0f} MB, "
+          f"peak concurrency {governor.peak_active}, paused {governor.pauses} times, final limit {governor.limit}")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--videos", type=int, default=40)
+    parser.add_argument("--comments", type=int, default=5000)
+    parser.add_argument("--delay", type=float, default=0.05, help="Seconds each fake extraction takes")
+    parser.add_argument("--budget", type=float, default=200.0, help="Memory budget in MB for the governed run")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args)
+        return
+
+    common = [sys.executable, os.path.abspath(__file__), "--child", "--videos", str(args.videos),
+              "--comments", str(args.comments), "--delay", str(args.delay)]
+    subprocess.run(common + ["--budget", "0"], check=True)
+    subprocess.run(common + ["--budget", str(args.budget)], check=True)
+
+if __name__ == "__main__":
+    main()
+
@@ -0,0 +1,120 @@
+import asyncio
+import sqlite3
+import sys
+import threading
+import time
+
+import pytest
+
+CHANNEL_URL = "https://www.youtube.com/@example"
+CHANNEL_ID = "channel"
+
+class FakeYtDlp:
+    """Stand-in for the yt_dlp module serving a playlist and canned per-video info."""
+
+    def __init__(self):
+        self.entries = []
+        self.videos = {}
+        self.delay = 0.0
+        self.delays = {}
+        self.extracted = []
+        self.lock = threading.Lock()
+        fake = self
+
+        class YoutubeDL:
+            def __init__(self, opts):
+                pass
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def extract_info(self, url, download=False):
+                return fake.extract_info(url)
+
+        self.YoutubeDL = YoutubeDL
+
+    def add_video(self, video_id, comments=2, **fields):
+        """Add a video to the playlist; fields go into both its entry and its info."""
+        self.entries.append({"id": video_id, "url": f"https://www.youtube.com/watch?v={video_id}", **fields})
+        self.videos[video_id] = {
+            "id": video_id,
+            "title": f"Video {video_id}",
+            "upload_date": "20240101",
+            "view_count": 100,
+            "like_count": 10,
+            "duration": 60,
+            "comments": [
+                {"id": f"{video_id}-c{i}", "author": "someone", "text": "nice", "timestamp": 1700000000}
+                for i in range(comments)
+            ],
+            **fields,
+        }
+
+    def extract_info(self, url):
+        if url.endswith(("/videos", "/shorts")):
+            return {"entries": list(self.entries)}
+        video_id = url.rsplit("=", 1)[1]
+        time.sleep(self.delays.get(video_id, self.delay))
+        with self.lock:
+            self.extracted.append(video_id)
+        return self.make_info(video_id)
+
+    def make_info(self, video_id):
+        return dict(self.videos[video_id])
+
+def make_item(video_id, views=100, upload_date="2024-01-05", comments=2, replies=1):
+    return {
+        "video_id": video_id,
+        "title": f"Video {video_id}",
+        "description": "",
+        "views": views,
+        "duration": 60,
+        "upload_date": upload_date,
+        "likes": 5,
+        "comment_count": comments,
+        "comments": [{
+            "comment_id": f"{video_id}-c{i}",
+            "text": "nice",
+            "author": "someone",
+            "channel_id": "N/A",
+            "timestamp": "2024-01-05T00:00:00",
+            "replies": [{
+                "reply_id": f"{video_id}-c{i}-r{j}",
+                "text": "thanks",
+                "author": "owner",
+                "timestamp": "2024-01-06T00:00:00"
+            } for j in range(replies)]
+        } for i in range(comments)]
+    }
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """Run in an empty directory against a fresh database."""
+    from youtube_scraper import config, db, scraper
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(config, "DATABASE_NAME", str(tmp_path / "test.db"))
+    monkeypatch.setattr(scraper, "memory_usage_mb", lambda: 0.0)
+    db.init_database()
+    return tmp_path
+
+@pytest.fixture
+def fake_yt_dlp(monkeypatch):
+    fake = FakeYtDlp()
+    monkeypatch.setitem(sys.modules, "yt_dlp", fake)
+    return fake
+
+def scrape(content_type="videos", **kwargs):
+    """Run scrape_videos_shorts for the test channel."""
+    from youtube_scraper import scraper
+    return asyncio.run(scraper.scrape_videos_shorts(CHANNEL_URL, content_type, None, CHANNEL_ID, **kwargs))
+
+def saved_ids(table="Videos", id_field="video_id"):
+    from youtube_scraper import config
+    conn = sqlite3.connect(config.DATABASE_NAME)
+    try:
+        return {row[0] for row in conn.execute(f"SELECT {id_field} FROM {table}")}
+    finally:
+        conn.close()
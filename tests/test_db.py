@@ -0,0 +1,83 @@
+import sqlite3
+
+import pytest
+
+from youtube_scraper import config, db
+
+from conftest import CHANNEL_ID, make_item
+
+class RecordingConnection(sqlite3.Connection):
+    """Connection that remembers how many rows it changed before being closed."""
+    changes = []
+
+    def close(self):
+        RecordingConnection.changes.append(self.total_changes)
+        super().close()
+
+@pytest.fixture
+def row_writes(monkeypatch):
+    """Rows changed by each connection db opens, most recent last."""
+    RecordingConnection.changes = []
+    monkeypatch.setattr(db, "get_db_connection",
+                        lambda: sqlite3.connect(config.DATABASE_NAME, factory=RecordingConnection))
+    return RecordingConnection.changes
+
+def stored_rows(table, key_field):
+    conn = sqlite3.connect(config.DATABASE_NAME)
+    try:
+        return {row[0]: row[1:] for row in conn.execute(f"SELECT {key_field}, rowid, content_hash FROM {table}")}
+    finally:
+        conn.close()
+
+def test_unchanged_resave_writes_only_the_video_row(workdir, row_writes):
+    item = make_item("a", comments=50, replies=2)
+    db.save_video_or_short("videos", item, CHANNEL_ID)
+    comments = stored_rows("Videos_Comments", "comment_id")
+    replies = stored_rows("Videos_Replies", "reply_id")
+
+    db.save_video_or_short("videos", make_item("a", comments=50, replies=2), CHANNEL_ID)
+
+    # Only the video's last-seen time is touched
+    assert row_writes[-1] == 1
+    assert stored_rows("Videos_Comments", "comment_id") == comments
+    assert stored_rows("Videos_Replies", "reply_id") == replies
+
+def test_changed_comment_is_rewritten(workdir, row_writes):
+    db.save_video_or_short("videos", make_item("a", comments=3), CHANNEL_ID)
+    comments = stored_rows("Videos_Comments", "comment_id")
+
+    item = make_item("a", comments=3)
+    item["comments"][1]["text"] = "edited"
+    db.save_video_or_short("videos", item, CHANNEL_ID)
+
+    assert row_writes[-1] == 2
+    after = stored_rows("Videos_Comments", "comment_id")
+    assert after["a-c1"][1] != comments["a-c1"][1]
+    assert after["a-c0"] == comments["a-c0"] and after["a-c2"] == comments["a-c2"]
+
+def test_tables_without_content_hash_are_migrated(workdir, row_writes):
+    conn = sqlite3.connect(config.DATABASE_NAME)
+    conn.execute("DROP TABLE Videos_Comments")
+    conn.execute('''
+        CREATE TABLE Videos_Comments (
+            comment_id TEXT PRIMARY KEY,
+            video_id TEXT,
+            text TEXT,
+            author TEXT,
+            channel_id TEXT,
+            timestamp TEXT,
+            fetched_at TEXT
+        )
+    ''')
+    conn.execute("INSERT INTO Videos_Comments VALUES ('old', 'x', 'kept', 'someone', 'N/A', '', '2024-01-01 00:00:00')")
+    conn.commit()
+    conn.close()
+
+    db.init_database()
+
+    assert stored_rows("Videos_Comments", "comment_id")["old"][1] is None
+    db.save_video_or_short("videos", make_item("a", comments=2, replies=0), CHANNEL_ID)
+    db.save_video_or_short("videos", make_item("a", comments=2, replies=0), CHANNEL_ID)
+    assert row_writes[-1] == 1
+    rows = stored_rows("Videos_Comments", "comment_id")
+    assert rows["old"][1] is None and all(rows[f"a-c{i}"][1] for i in range(2))
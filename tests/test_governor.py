@@ -0,0 +1,153 @@
+import asyncio
+import threading
+import time
+
+from youtube_scraper import config
+from youtube_scraper.governor import MemoryGovernor
+
+from conftest import saved_ids, scrape
+
+def test_queued_extractions_do_not_time_out(workdir, fake_yt_dlp, monkeypatch):
+    # More jobs than the default executor has threads, each well inside the timeout
+    monkeypatch.setattr(config, "TASK_TIMEOUT", 0.5)
+    monkeypatch.setattr(config, "CHECKPOINT_INTERVAL", 40)
+    fake_yt_dlp.delay = 0.3
+    for i in range(40):
+        fake_yt_dlp.add_video(f"v{i}", comments=0)
+
+    scrape(governor=MemoryGovernor(40))
+
+    assert len(saved_ids()) == 40
+
+def test_timed_out_extraction_keeps_its_slot_until_the_thread_ends(workdir, fake_yt_dlp, monkeypatch):
+    monkeypatch.setattr(config, "TASK_TIMEOUT", 0.2)
+    fake_yt_dlp.delays["slow"] = 0.8
+    for video_id in ("slow", "a", "b"):
+        fake_yt_dlp.add_video(video_id, comments=0)
+    governor = MemoryGovernor(2)
+
+    scrape(governor=governor)
+
+    assert saved_ids() == {"a", "b"}
+    assert governor.orphaned == 1
+    time.sleep(1.0)
+    assert governor.orphaned == 0
+    assert fake_yt_dlp.extracted.count("slow") == 1
+
+def test_governor_pauses_over_budget_and_resumes_below_low_water():
+    usage = [100.0]
+    governor = MemoryGovernor(8, memory_budget_mb=200, low_water_ratio=0.5, rss_fn=lambda: usage[0])
+
+    async def run():
+        # Slow start: the limit doubles on each release while memory is low
+        for _ in range(3):
+            await governor.acquire()
+            await governor.release()
+        assert governor.limit == 8
+        for _ in range(4):
+            await governor.acquire()
+
+        usage[0] = 250.0
+        governor.update()
+        assert governor.paused and governor.limit == 2
+        assert not governor.can_start()
+
+        # Still over the low-water mark with work running: stay paused
+        usage[0] = 150.0
+        governor.update()
+        assert governor.paused
+
+        usage[0] = 90.0
+        governor.update()
+        assert not governor.paused
+        assert not governor.can_start()  # 4 running, limit 2
+        for _ in range(3):
+            await governor.release()
+        assert governor.can_start()
+
+    asyncio.run(run())
+    assert governor.pauses == 1
+
+def test_governor_resumes_once_work_drains_even_if_rss_stays_high():
+    usage = [100.0]
+    governor = MemoryGovernor(8, memory_budget_mb=200, rss_fn=lambda: usage[0])
+
+    async def run():
+        await governor.acquire()
+        usage[0] = 210.0
+        governor.update()
+        assert governor.paused
+        usage[0] = 190.0  # RSS that is not handed back stays above low water
+        await governor.release()
+        governor.update()
+        assert not governor.paused and governor.can_start()
+        # Memory is being reused rather than growing, so the limit creeps back up
+        for _ in range(3):
+            await governor.acquire()
+            await governor.release()
+        assert governor.limit > 1
+
+    asyncio.run(run())
+
+class Payload:
+    """Oversized extraction result whose lifetime drives the fake RSS."""
+    lock = threading.Lock()
+    live = 0
+    peak = 0
+
+    def __init__(self):
+        with Payload.lock:
+            Payload.live += 1
+            Payload.peak = max(Payload.peak, Payload.live)
+
+    def __del__(self):
+        with Payload.lock:
+            Payload.live -= 1
+
+def scrape_oversized(fake_yt_dlp, governor, videos=20):
+    make_info = fake_yt_dlp.make_info
+
+    def oversized_info(video_id):
+        payload = Payload()
+        time.sleep(0.05)
+        return dict(make_info(video_id), payload=payload)
+
+    fake_yt_dlp.make_info = oversized_info
+    for i in range(videos):
+        fake_yt_dlp.add_video(f"v{i}")
+    Payload.live = Payload.peak = 0
+    return scrape(governor=governor)
+
+def fake_rss():
+    return 100 + 50 * Payload.live
+
+def test_scrape_backs_off_under_memory_pressure(workdir, fake_yt_dlp, monkeypatch):
+    monkeypatch.setattr(config, "EXPORT_COMMENTS", False)
+    governor = MemoryGovernor(10, memory_budget_mb=180, poll_interval=0.01, rss_fn=fake_rss)
+
+    data, checkpoint_data = scrape_oversized(fake_yt_dlp, governor)
+
+    assert governor.pauses >= 1
+    assert governor.peak_active < 10
+    assert Payload.peak < 10
+    # Work resumed after every pause and nothing was dropped
+    assert len(saved_ids()) == 20
+    assert all("comments" not in item for item in data["videos"] + checkpoint_data["videos"])
+
+def test_scrape_without_budget_runs_at_full_concurrency(workdir, fake_yt_dlp):
+    governor = MemoryGovernor(10, rss_fn=fake_rss)
+
+    data, _ = scrape_oversized(fake_yt_dlp, governor)
+
+    assert governor.peak_active == 10
+    assert len(saved_ids()) == 20
+    assert all(item["comments"] for item in data["videos"])
+
+def test_budget_alone_keeps_comments_in_the_export(workdir, fake_yt_dlp, caplog):
+    fake_yt_dlp.add_video("v0")
+
+    data, checkpoint_data = scrape(governor=MemoryGovernor(4, memory_budget_mb=10_000, rss_fn=lambda: 100))
+
+    assert data["videos"][0]["comments"]
+    assert "comments" not in checkpoint_data["videos"][0]
+    assert "--no-export-comments" in caplog.text
@@ -0,0 +1,27 @@
+import json
+import os
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ("yt_dlp", "selenium", "webdriver_manager", "aiohttp", "dateutil", "psutil")
+
+CHECK_IMPORT = f"""
+import json, logging, sys
+import youtube_scraper.cli
+import youtube_scraper.scraper
+print(json.dumps({{
+    "loaded": [name for name in {HEAVY_MODULES!r} if name in sys.modules],
+    "root_handlers": len(logging.getLogger().handlers),
+}}))
+"""
+
+def test_importing_the_package_has_no_side_effects(tmp_path):
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT)
+    output = subprocess.run([sys.executable, "-c", CHECK_IMPORT], cwd=tmp_path, env=env,
+                            capture_output=True, text=True, check=True).stdout
+
+    result = json.loads(output)
+    assert result["loaded"] == []
+    assert result["root_handlers"] == 0
+    assert not list(tmp_path.glob("youtube_scraper_*.log"))
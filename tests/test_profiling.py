@@ -0,0 +1,49 @@
+import threading
+
+from youtube_scraper import profiling
+
+from conftest import saved_ids, scrape
+
+def test_profiled_scrape_saves_videos(workdir, fake_yt_dlp):
+    for i in range(4):
+        fake_yt_dlp.add_video(f"v{i}")
+    profiling.enable_profiling(str(workdir / "profile"))
+    try:
+        data, _ = scrape()
+    finally:
+        report_file = profiling.write_profile_report()
+
+    assert saved_ids() == {"v0", "v1", "v2", "v3"}
+    assert len(data["videos"]) == 4
+    with open(report_file, encoding="utf-8") as f:
+        report = f.read()
+    assert "extract_info" in report
+    assert "save_video_or_short" in report
+    assert "process-wide change in traced memory" in report
+
+def test_stage_finishing_after_the_report_exits_cleanly(tmp_path):
+    started, release = threading.Event(), threading.Event()
+    outcome = []
+
+    def slow_extraction():
+        started.set()
+        release.wait(5)
+        return "done"
+
+    def worker():
+        try:
+            outcome.append(profiling.profiled_call("extract_info", slow_extraction))
+        except Exception as e:
+            outcome.append(e)
+
+    profiling.enable_profiling(str(tmp_path), trace_allocations=False)
+    thread = threading.Thread(target=worker)
+    thread.start()
+    try:
+        assert started.wait(5)
+    finally:
+        profiling.write_profile_report()
+    release.set()
+    thread.join(5)
+
+    assert outcome == ["done"]
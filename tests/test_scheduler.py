@@ -0,0 +1,136 @@
+import sqlite3
+
+from youtube_scraper import config, db
+from youtube_scraper.governor import MemoryGovernor
+from youtube_scraper.scheduler import (
+    new_run_budget, priority_recency, priority_staleness, priority_views, take_from_budget
+)
+
+from conftest import saved_ids, scrape
+
+def new_checkpoint():
+    return {"videos": [], "shorts": [], "channel_info": {"channel_id": "channel"},
+            "videos_processed": 0, "shorts_processed": 0}
+
+def set_stored(video_id, **columns):
+    conn = sqlite3.connect(config.DATABASE_NAME)
+    try:
+        for column, value in columns.items():
+            conn.execute(f"UPDATE Videos SET {column} = ? WHERE video_id = ?", (value, video_id))
+        conn.commit()
+    finally:
+        conn.close()
+
+def store_videos(fake_yt_dlp, video_ids):
+    """Add videos to the playlist and save them with a first playlist-order run."""
+    for video_id in video_ids:
+        fake_yt_dlp.add_video(video_id, comments=0)
+    _, checkpoint_data = scrape(checkpoint_data=new_checkpoint())
+    fake_yt_dlp.extracted.clear()
+    return checkpoint_data
+
+def test_priority_functions_fall_back_to_stored_values():
+    assert priority_recency({"timestamp": 200}, None) == 200
+    assert priority_recency({}, {"upload_date": "2024-02-01"}) > priority_recency({}, {"upload_date": "2024-01-01"})
+    assert priority_recency({}, None) == float("inf")
+    assert priority_views({"view_count": 5}, {"views": 50}) == 5
+    assert priority_views({}, {"views": 50}) == 50
+    assert priority_views({}, None) == float("inf")
+    older = priority_staleness({}, {"fetched_at": "2024-01-01 00:00:00"})
+    newer = priority_staleness({}, {"fetched_at": "2024-06-01 00:00:00"})
+    assert older > newer
+    assert priority_staleness({}, None) == float("inf")
+
+def test_staleness_refreshes_least_recently_fetched_first(workdir, fake_yt_dlp):
+    checkpoint_data = store_videos(fake_yt_dlp, ["a", "b", "c"])
+    set_stored("a", fetched_at="2024-03-01 00:00:00")
+    set_stored("b", fetched_at="2024-01-01 00:00:00")
+    set_stored("c", fetched_at="2024-02-01 00:00:00")
+    fake_yt_dlp.add_video("new", comments=0)
+
+    scrape(priority="staleness", checkpoint_data=checkpoint_data, governor=MemoryGovernor(1))
+
+    assert fake_yt_dlp.extracted == ["new", "b", "c", "a"]
+
+def test_views_priority_uses_stored_view_counts(workdir, fake_yt_dlp):
+    checkpoint_data = store_videos(fake_yt_dlp, ["a", "b", "c"])
+    for video_id, views in (("a", 10), ("b", 300), ("c", 20)):
+        set_stored(video_id, views=views)
+
+    scrape(priority="views", checkpoint_data=checkpoint_data, budget=new_run_budget(None, 2), governor=MemoryGovernor(1))
+
+    assert fake_yt_dlp.extracted == ["b", "c"]
+
+def test_recency_priority_uses_stored_upload_dates(workdir, fake_yt_dlp):
+    checkpoint_data = store_videos(fake_yt_dlp, ["a", "b", "c"])
+    for video_id, upload_date in (("a", "2023-05-01"), ("b", "2022-01-01"), ("c", "2024-07-01")):
+        set_stored(video_id, upload_date=upload_date)
+
+    scrape(priority="recency", checkpoint_data=checkpoint_data, budget=new_run_budget(None, 1), governor=MemoryGovernor(1))
+
+    assert fake_yt_dlp.extracted == ["c"]
+
+def test_request_budget_stops_run_and_next_run_resumes(workdir, fake_yt_dlp):
+    for i in range(5):
+        fake_yt_dlp.add_video(f"v{i}", comments=0)
+
+    _, checkpoint_data = scrape(checkpoint_data=new_checkpoint(), budget=new_run_budget(None, 3))
+
+    assert saved_ids() == {"v0", "v1", "v2"}
+    assert checkpoint_data["videos_processed"] == 3
+
+    _, checkpoint_data = scrape(checkpoint_data=checkpoint_data, start_index=checkpoint_data["videos_processed"])
+
+    assert fake_yt_dlp.extracted.count("v0") == 1
+    assert len(saved_ids()) == 5
+    assert checkpoint_data["videos_processed"] == 5
+
+def test_spent_time_budget_skips_the_pass(workdir, fake_yt_dlp):
+    fake_yt_dlp.add_video("v0", comments=0)
+
+    data, _ = scrape(budget=new_run_budget(0, None))
+
+    assert data["videos"] == [] and fake_yt_dlp.extracted == []
+
+def test_take_from_budget_truncates_to_remaining_requests():
+    budget = new_run_budget(None, 3)
+    assert take_from_budget(budget, [1, 2]) == [1, 2]
+    assert take_from_budget(budget, [3, 4]) == [3]
+    assert take_from_budget(budget, [5]) == []
+
+def test_priority_run_keeps_checkpoint_a_playlist_position(workdir, fake_yt_dlp):
+    for i, views in enumerate((1, 2, 3, 500, 400)):
+        fake_yt_dlp.add_video(f"v{i}", comments=0, view_count=views)
+
+    _, checkpoint_data = scrape(priority="views", checkpoint_data=new_checkpoint(), budget=new_run_budget(None, 2))
+
+    assert saved_ids() == {"v3", "v4"}
+    assert checkpoint_data["videos_processed"] == 0
+
+    # A playlist-order run picks up everything the priority run left
+    fake_yt_dlp.extracted.clear()
+    _, checkpoint_data = scrape(checkpoint_data=checkpoint_data, start_index=checkpoint_data["videos_processed"])
+
+    assert sorted(fake_yt_dlp.extracted) == ["v0", "v1", "v2"]
+    assert checkpoint_data["videos_processed"] == 5
+    assert len(checkpoint_data["videos"]) == 5
+
+def test_known_items_are_looked_up_only_for_the_playlist(workdir, fake_yt_dlp, monkeypatch):
+    store_videos(fake_yt_dlp, [f"v{i}" for i in range(5)] + ["other"])
+    monkeypatch.setattr(db, "LOOKUP_CHUNK_SIZE", 2)
+
+    known = db.load_known_items("videos", ["v0", "v1", "v2", "v3", "v4", "missing"])
+
+    assert set(known) == {"v0", "v1", "v2", "v3", "v4"}
+    assert known["v0"]["views"] == 100
+
+def test_defaults_follow_config_changed_after_import(workdir, fake_yt_dlp, monkeypatch):
+    monkeypatch.setattr(config, "RUN_REQUEST_BUDGET", 1)
+    monkeypatch.setattr(config, "PRIORITY", "views")
+    for i, views in enumerate((1, 50, 2)):
+        fake_yt_dlp.add_video(f"v{i}", comments=0, view_count=views)
+
+    assert new_run_budget()["max_requests"] == 1
+    scrape(budget=new_run_budget())
+
+    assert fake_yt_dlp.extracted == ["v1"]
@@ -0,0 +1,42 @@
+import sqlite3
+
+from youtube_scraper import config, db, stats
+
+from conftest import CHANNEL_ID, make_item
+
+def test_incremental_stats_match_rebuild(workdir):
+    db.save_video_or_short("videos", make_item("a"), CHANNEL_ID)
+    db.save_video_or_short("videos", make_item("b", upload_date="2024-02-01"), CHANNEL_ID)
+    db.save_video_or_short("videos", make_item("a", views=250, upload_date="2024-03-09", comments=3), CHANNEL_ID)
+    db.save_video_or_short("shorts", make_item("s", comments=0), CHANNEL_ID)
+    incremental = (stats.get_channel_stats(CHANNEL_ID), stats.get_monthly_stats(CHANNEL_ID))
+
+    stats.rebuild_stats()
+
+    assert (stats.get_channel_stats(CHANNEL_ID), stats.get_monthly_stats(CHANNEL_ID)) == incremental
+    videos = incremental[0]["videos"]
+    assert (videos["item_count"], videos["total_views"], videos["comment_count"], videos["reply_count"]) == (2, 350, 5, 5)
+    assert [row["upload_month"] for row in incremental[1] if row["content_type"] == "videos"] == ["2024-02", "2024-03"]
+
+def test_save_reads_old_state_inside_write_transaction(workdir, monkeypatch):
+    db.save_video_or_short("videos", make_item("a"), CHANNEL_ID)
+    lock_held = []
+    load_content_hashes = db.load_content_hashes
+
+    def probe(*args, **kwargs):
+        # A second writer must be locked out while the old state is being read
+        other = sqlite3.connect(config.DATABASE_NAME, timeout=0)
+        try:
+            other.execute("BEGIN IMMEDIATE")
+            lock_held.append(False)
+        except sqlite3.OperationalError:
+            lock_held.append(True)
+        finally:
+            other.close()
+        return load_content_hashes(*args, **kwargs)
+
+    monkeypatch.setattr(db, "load_content_hashes", probe)
+    db.save_video_or_short("videos", make_item("a", views=300), CHANNEL_ID)
+
+    assert lock_held and all(lock_held)
+    assert stats.get_channel_stats(CHANNEL_ID)["videos"]["total_views"] == 300
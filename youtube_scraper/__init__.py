@@ -0,0 +1,8 @@
+"""YouTube channel scraper built on yt-dlp, with a Selenium fallback for channel info.
+
+Importing the package is cheap: yt-dlp, Selenium, aiohttp, dateutil and psutil
+are only loaded by the code paths that use them, and logging is configured by
+the CLI rather than at import time.
+"""
+
+__version__ = "0.1.0"
@@ -0,0 +1,183 @@
+import hashlib
+import logging
+import time
+from datetime import datetime
+
+from . import config
+from .profiling import staged
+from .utils import convert_to_int, sanitize_log_message
+
+logger = logging.getLogger(__name__)
+
+@staged("channel_info_selenium")
+def scrape_channel_info_selenium(channel_url):
+    """Scrape channel info using Selenium with improved error handling."""
+    # Selenium is only needed for this step, so keep it out of module import
+    from selenium import webdriver
+    from selenium.common.exceptions import TimeoutException, WebDriverException
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.edge.options import Options
+    from selenium.webdriver.edge.service import Service
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+    from webdriver_manager.microsoft import EdgeChromiumDriverManager
+
+    logger.info("Starting channel info scraping with Selenium")
+    start_time = time.time()
+    
+    options = Options()
+    options.add_argument('--headless')
+    options.add_argument('--disable-gpu')
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument('--log-level=3')
+    service = Service(EdgeChromiumDriverManager().install())
+    driver = None
+    
+    channel_id = hashlib.md5(channel_url.encode()).hexdigest()  # Unique ID based on URL
+    data = {
+        "channel_id": channel_id,
+        "channel_title": None,
+        "subscribers": None,
+        "totalviews": None,
+        "joined_date": None,
+        "total_videos": None,
+        "origin": None,
+        "channel_description": None,
+        "descriptionlinks": None,
+        "monitized": 0,
+        "fetched_at": datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    }
+
+    for attempt in range(config.RETRY_LIMIT):
+        try:
+            logger.info(f"Attempt {attempt + 1}/{config.RETRY_LIMIT} to load {channel_url}")
+            driver = webdriver.Edge(service=service, options=options)
+            driver.set_page_load_timeout(20)
+            driver.get(channel_url)
+            WebDriverWait(driver, 5).until(lambda d: d.execute_script('return document.readyState') == 'complete')
+            logger.info("Channel page loaded successfully")
+            break
+        except (TimeoutException, WebDriverException) as e:
+            logger.error(f"Failed to load page on attempt {attempt + 1}: {e}")
+            if driver:
+                driver.quit()
+            if attempt + 1 == config.RETRY_LIMIT:
+                logger.error("Max retries reached, returning default data")
+                return data
+            time.sleep(2 * (attempt + 1))
+
+    try:
+        # Channel title
+        try:
+            title_element = driver.find_element(By.CSS_SELECTOR, "meta[name='title']")
+            data["channel_title"] = title_element.get_attribute("content").replace(" - YouTube", "")
+            logger.info(f"Extracted channel title: {sanitize_log_message(data['channel_title'])}")
+        except Exception as e:
+            data["channel_title"] = driver.title.replace(" - YouTube", "")
+            logger.info(f"Fallback to driver title: {sanitize_log_message(data['channel_title'])}")
+
+        # Description tab
+        try:
+            description_button = WebDriverWait(driver, 2).until(
+                EC.element_to_be_clickable((By.XPATH, "//button[contains(@aria-label, 'Description')]"))
+            )
+            driver.execute_script("arguments[0].click();", description_button)
+            logger.info("Clicked description tab")
+            WebDriverWait(driver, 2).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "#additional-info-container > table"))
+            )
+
+            # Extract table data
+            table = driver.find_element(By.CSS_SELECTOR, "#additional-info-container > table")
+            rows = table.find_elements(By.CSS_SELECTOR, "tr.description-item")
+            logger.debug(f"Found {len(rows)} table rows")
+            for row in rows:
+                try:
+                    value_cell = row.find_element(By.CSS_SELECTOR, "td:nth-child(2)")
+                    row_text = value_cell.text.strip()
+                    row_lower = row_text.lower()
+
+                    if "subscribers" in row_lower:
+                        data["subscribers"] = convert_to_int(row_text)
+                        logger.info(f"Extracted subscribers: {data['subscribers']}")
+                    elif "video" in row_lower:
+                        digits = ''.join(filter(str.isdigit, row_text))
+                        data["total_videos"] = int(digits) if digits else None
+                        logger.info(f"Extracted total videos: {data['total_videos']}")
+                    elif "views" in row_lower:
+                        data["totalviews"] = convert_to_int(row_text)
+                        logger.info(f"Extracted total views: {data['totalviews']}")
+                    elif any(keyword in row_lower for keyword in ["joined", "date"]):
+                        data["joined_date"] = row_text
+                        logger.info(f"Extracted joined date: {sanitize_log_message(data['joined_date'])}")
+                    elif row_text in ["United States", "India", "Canada", "United Kingdom"]:
+                        data["origin"] = row_text
+                        logger.info(f"Extracted origin: {data['origin']}")
+                except Exception as e:
+                    logger.debug(f"Error processing row: {e}")
+
+            # Description
+            try:
+                data["channel_description"] = driver.find_element(By.CSS_SELECTOR, "#description-container > span").text.strip()
+                logger.info(f"Extracted description: {sanitize_log_message(data['channel_description'][:50])}...")
+            except Exception as e:
+                logger.warning(f"Could not extract channel description: {e}")
+
+            # Links
+            try:
+                data["descriptionlinks"] = driver.find_element(By.CSS_SELECTOR, "div#link-list-container").text.strip()
+                logger.info(f"Extracted description links: {sanitize_log_message(data['descriptionlinks'][:50])}...")
+            except Exception as e:
+                logger.warning(f"Could not extract description links: {e}")
+
+            # Monetization
+            if 'badge-style-type-verified' in driver.page_source:
+                data["monitized"] = 1
+                logger.info("Channel is monetized")
+        except Exception as e:
+            logger.error(f"Error extracting description data: {e}")
+
+        # Fallback: Scrape total videos from Videos tab
+        if data["total_videos"] is None:
+            try:
+                videos_button = WebDriverWait(driver, 2).until(
+                    EC.element_to_be_clickable((By.XPATH, "//button[contains(@aria-label, 'Videos')]"))
+                )
+                driver.execute_script("arguments[0].click();", videos_button)
+                logger.info("Clicked videos tab")
+                WebDriverWait(driver, 3).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "#video-count, #metadata-line, yt-formatted-string[aria-label*='videos']"))
+                )
+
+                video_count = None
+                selectors = ["#video-count", "#metadata-line", "yt-formatted-string[aria-label*='videos']"]
+                for selector in selectors:
+                    try:
+                        elements = driver.find_elements(By.CSS_SELECTOR, selector)
+                        for element in elements:
+                            text = element.text.lower()
+                            logger.debug(f"Checking selector {selector}: {text}")
+                            if "video" in text:
+                                digits = ''.join(filter(str.isdigit, text))
+                                if digits:
+                                    video_count = int(digits)
+                                    logger.info(f"Extracted total videos from selector {selector}: {video_count}")
+                                    break
+                        if video_count is not None:
+                            break
+                    except Exception as e:
+                        logger.debug(f"Selector {selector} not found: {e}")
+
+                data["total_videos"] = video_count if video_count is not None else 0
+                logger.info(f"Final total videos: {data['total_videos']}")
+            except Exception as e:
+                logger.error(f"Error extracting total videos: {e}")
+                data["total_videos"] = 0
+
+    finally:
+        if driver:
+            driver.quit()
+        logger.info(f"Channel info scraping completed in {time.time() - start_time:.2f} seconds")
+
+    return data
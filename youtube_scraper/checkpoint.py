@@ -0,0 +1,41 @@
+import json
+import logging
+import os
+
+from .profiling import staged
+from .utils import sanitize_filename
+
+logger = logging.getLogger(__name__)
+
+def load_checkpoint(channel_id):
+    """Load checkpoint data if it exists."""
+    checkpoint_file = f"{sanitize_filename(channel_id)}_checkpoint.json"
+    default_checkpoint = {
+        "channel_info_scraped": False,
+        "videos_processed": 0,
+        "shorts_processed": 0,
+        "videos": [],
+        "shorts": []
+    }
+    if os.path.exists(checkpoint_file):
+        try:
+            with open(checkpoint_file, 'r', encoding='utf-8') as f:
+                checkpoint = json.load(f)
+                for key in default_checkpoint:
+                    if key not in checkpoint:
+                        checkpoint[key] = default_checkpoint[key]
+                return checkpoint
+        except Exception as e:
+            logger.error(f"Error loading checkpoint: {e}")
+    return default_checkpoint
+
+@staged("save_checkpoint", track_allocations=True)
+def save_checkpoint(channel_id, checkpoint_data):
+    """Save checkpoint data."""
+    checkpoint_file = f"{sanitize_filename(channel_id)}_checkpoint.json"
+    try:
+        with open(checkpoint_file, 'w', encoding='utf-8') as f:
+            json.dump(checkpoint_data, f, indent=4, ensure_ascii=False)
+        logger.info(f"Checkpoint saved to {checkpoint_file}")
+    except Exception as e:
+        logger.error(f"Error saving checkpoint: {e}")
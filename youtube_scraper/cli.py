@@ -0,0 +1,88 @@
+import argparse
+import logging
+import os
+from datetime import datetime
+
+from . import config
+from .scheduler import PRIORITY_FUNCTIONS
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHANNEL_URL = "https://www.youtube.com/@tariqjamilofficial"
+
+def setup_logging(log_dir=".", level=logging.INFO):
+    """Log to the console and a timestamped file, returning the file path."""
+    log_file = os.path.join(log_dir, f"youtube_scraper_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log")
+    logging.basicConfig(
+        level=level,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler(log_file, encoding='utf-8'),
+            logging.StreamHandler()
+        ]
+    )
+    return log_file
+
+def build_parser():
+    """Build the command line argument parser."""
+    parser = argparse.ArgumentParser(prog="youtube-scraper", description="Scrape a YouTube channel into SQLite.")
+    parser.add_argument("channel_url", nargs="?", default=DEFAULT_CHANNEL_URL, help="Channel URL to scrape")
+    parser.add_argument("--db", default=config.DATABASE_NAME, help="SQLite database file")
+    parser.add_argument("--priority", default=config.PRIORITY, choices=["playlist", *PRIORITY_FUNCTIONS],
+                        help="Order in which videos/shorts are processed; all but playlist also refresh stored items")
+    parser.add_argument("--time-budget", type=float, default=config.RUN_TIME_BUDGET,
+                        help="Stop after this many seconds")
+    parser.add_argument("--request-budget", type=int, default=config.RUN_REQUEST_BUDGET,
+                        help="Stop after this many video/short extractions")
+    parser.add_argument("--max-concurrent", type=int, default=config.MAX_CONCURRENT_REQUESTS,
+                        help="Maximum concurrent extractions")
+    parser.add_argument("--memory-budget", type=float, default=config.MEMORY_BUDGET_MB,
+                        help="Memory budget in MB; concurrency backs off as it is approached")
+    parser.add_argument("--no-export-comments", dest="export_comments", action="store_false",
+                        default=config.EXPORT_COMMENTS,
+                        help="Leave comments out of the JSON export so they are not held in memory "
+                             "(they are still saved to the database)")
+    parser.add_argument("--profile", action="store_true",
+                        help="Profile the run and write a per-stage CPU/allocation report")
+    parser.add_argument("--profile-dir", default=".", help="Directory for the profile report")
+    parser.add_argument("--no-profile-allocations", dest="profile_allocations", action="store_false",
+                        help="With --profile, skip tracemalloc allocation tracking")
+    parser.add_argument("--rebuild-stats", action="store_true",
+                        help="Recompute the channel aggregate tables from scratch and exit")
+    parser.add_argument("--log-dir", default=".", help="Directory for the log file")
+    parser.add_argument("--log-level", default="INFO", choices=["DEBUG", "INFO", "WARNING", "ERROR"])
+    return parser
+
+def main(argv=None):
+    """Command line entry point."""
+    args = build_parser().parse_args(argv)
+    log_file = setup_logging(args.log_dir, getattr(logging, args.log_level))
+    config.DATABASE_NAME = args.db
+    config.MAX_CONCURRENT_REQUESTS = args.max_concurrent
+    config.MEMORY_BUDGET_MB = args.memory_budget
+    config.EXPORT_COMMENTS = args.export_comments
+
+    if args.rebuild_stats:
+        from .db import init_database
+        from .stats import rebuild_stats
+        init_database()
+        rebuild_stats()
+        return
+
+    import asyncio
+    from .scraper import scrape_channel
+    if args.profile:
+        from .profiling import enable_profiling
+        enable_profiling(args.profile_dir, trace_allocations=args.profile_allocations)
+    try:
+        asyncio.run(scrape_channel(
+            args.channel_url,
+            priority=args.priority,
+            time_budget=args.time_budget,
+            request_budget=args.request_budget
+        ))
+    finally:
+        if args.profile:
+            from .profiling import write_profile_report
+            write_profile_report()
+    logger.info(f"Log file: {log_file}")
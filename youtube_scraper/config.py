@@ -0,0 +1,30 @@
+"""Scraper settings. The CLI overrides these per run."""
+
+MAX_CONCURRENT_REQUESTS = 60
+RETRY_LIMIT = 3
+TIMEOUT = 10
+TASK_TIMEOUT = 30
+CHECKPOINT_INTERVAL = 10
+PRIORITY = "playlist"  # One of PRIORITY_FUNCTIONS, or "playlist" for upload order
+RUN_TIME_BUDGET = None  # Seconds per run, None for unlimited
+RUN_REQUEST_BUDGET = None  # Video/short extractions per run, None for unlimited
+MEMORY_BUDGET_MB = None  # Back off concurrency near this RSS, None to disable
+MEMORY_LOW_WATER_RATIO = 0.8  # Resume once memory falls below this share of the budget
+EXPORT_COMMENTS = True  # Keep comments in the JSON export (held in memory until the run ends)
+DATABASE_NAME = "youtube_data.db"
+CONTENT_TABLES = (
+    "Channel_Info", "Videos", "Shorts",
+    "Videos_Comments", "Videos_Replies", "Shorts_Comments", "Shorts_Replies"
+)
+YDL_OPTS = {
+    'quiet': True,
+    'extract_flat': True,
+    'no_warnings': True,
+    'getcomments': True,
+    'http_headers': {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/126.0.0.0 Safari/537.36'},
+    'retries': 3,
+    'sleep_interval': 0.5,
+    'writeinfojson': False,
+    'skip_download': True,
+    'ignoreerrors': True,
+}
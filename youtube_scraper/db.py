@@ -0,0 +1,352 @@
+import hashlib
+import json
+import logging
+import sqlite3
+import uuid
+from datetime import datetime
+
+from . import config, stats
+from .profiling import staged
+
+logger = logging.getLogger(__name__)
+
+LOOKUP_CHUNK_SIZE = 500  # Keys per IN (...) query, under SQLite's bound-parameter limit
+
+def init_database():
+    """Initialize SQLite database and create tables."""
+    conn = sqlite3.connect(config.DATABASE_NAME)
+    cursor = conn.cursor()
+
+    # Channel_Info table
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS Channel_Info (
+            channel_id TEXT PRIMARY KEY,
+            channel_title TEXT,
+            subscribers INTEGER,
+            total_views INTEGER,
+            joined_date TEXT,
+            total_videos INTEGER,
+            origin TEXT,
+            channel_description TEXT,
+            description_links TEXT,
+            monetized INTEGER,
+            content_hash TEXT,
+            fetched_at TEXT
+        )
+    ''')
+
+    # Videos table
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS Videos (
+            video_id TEXT PRIMARY KEY,
+            channel_id TEXT,
+            title TEXT,
+            description TEXT,
+            views INTEGER,
+            duration INTEGER,
+            upload_date TEXT,
+            likes INTEGER,
+            comment_count INTEGER,
+            content_hash TEXT,
+            fetched_at TEXT,
+            FOREIGN KEY (channel_id) REFERENCES Channel_Info (channel_id)
+        )
+    ''')
+
+    # Shorts table
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS Shorts (
+            short_id TEXT PRIMARY KEY,
+            channel_id TEXT,
+            title TEXT,
+            description TEXT,
+            views INTEGER,
+            duration INTEGER,
+            upload_date TEXT,
+            likes INTEGER,
+            comment_count INTEGER,
+            content_hash TEXT,
+            fetched_at TEXT,
+            FOREIGN KEY (channel_id) REFERENCES Channel_Info (channel_id)
+        )
+    ''')
+
+    # Videos_Comments table
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS Videos_Comments (
+            comment_id TEXT PRIMARY KEY,
+            video_id TEXT,
+            text TEXT,
+            author TEXT,
+            channel_id TEXT,
+            timestamp TEXT,
+            content_hash TEXT,
+            fetched_at TEXT,
+            FOREIGN KEY (video_id) REFERENCES Videos (video_id)
+        )
+    ''')
+
+    # Videos_Replies table
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS Videos_Replies (
+            reply_id TEXT PRIMARY KEY,
+            comment_id TEXT,
+            text TEXT,
+            author TEXT,
+            timestamp TEXT,
+            content_hash TEXT,
+            fetched_at TEXT,
+            FOREIGN KEY (comment_id) REFERENCES Videos_Comments (comment_id)
+        )
+    ''')
+
+    # Shorts_Comments table
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS Shorts_Comments (
+            comment_id TEXT PRIMARY KEY,
+            short_id TEXT,
+            text TEXT,
+            author TEXT,
+            channel_id TEXT,
+            timestamp TEXT,
+            content_hash TEXT,
+            fetched_at TEXT,
+            FOREIGN KEY (short_id) REFERENCES Shorts (short_id)
+        )
+    ''')
+
+    # Shorts_Replies table
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS Shorts_Replies (
+            reply_id TEXT PRIMARY KEY,
+            comment_id TEXT,
+            text TEXT,
+            author TEXT,
+            timestamp TEXT,
+            content_hash TEXT,
+            fetched_at TEXT,
+            FOREIGN KEY (comment_id) REFERENCES Shorts_Comments (comment_id)
+        )
+    ''')
+
+    # Add content_hash to databases created before change detection existed
+    for table_name in config.CONTENT_TABLES:
+        cursor.execute(f'PRAGMA table_info({table_name})')
+        if 'content_hash' not in [column[1] for column in cursor.fetchall()]:
+            cursor.execute(f'ALTER TABLE {table_name} ADD COLUMN content_hash TEXT')
+            logger.info(f"Added content_hash column to {table_name}")
+
+    # Aggregate tables, backfilled once when added to an existing database
+    if stats.init_stats_tables(cursor):
+        stats.rebuild_stats_tables(cursor)
+        logger.info("Built channel stats tables")
+
+    conn.commit()
+    conn.close()
+    logger.info(f"Database initialized: {config.DATABASE_NAME}")
+
+def get_db_connection():
+    """Get a new database connection."""
+    return sqlite3.connect(config.DATABASE_NAME)
+
+def load_channel_info(channel_id):
+    """Load channel info from database if it exists."""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    try:
+        cursor.execute('''
+            SELECT channel_id, channel_title, subscribers, total_views, joined_date, total_videos,
+                   origin, channel_description, description_links, monetized, fetched_at
+            FROM Channel_Info WHERE channel_id = ?
+        ''', (channel_id,))
+        row = cursor.fetchone()
+        if row:
+            return {
+                "channel_id": row[0],
+                "channel_title": row[1],
+                "subscribers": row[2],
+                "totalviews": row[3],
+                "joined_date": row[4],
+                "total_videos": row[5],
+                "origin": row[6],
+                "channel_description": row[7],
+                "descriptionlinks": row[8],
+                "monitized": row[9],
+                "fetched_at": row[10]
+            }
+    except Exception as e:
+        logger.error(f"Error loading channel info from database: {e}")
+    finally:
+        conn.close()
+    return None
+
+def content_hash(row):
+    """Hash the content fields of a row so unchanged rows can be detected."""
+    return hashlib.md5(json.dumps(row, ensure_ascii=False, default=str).encode('utf-8')).hexdigest()
+
+def load_content_hashes(cursor, table_name, key_field, where, params):
+    """Load stored content hashes keyed by primary key."""
+    cursor.execute(f'SELECT {key_field}, content_hash FROM {table_name} WHERE {where}', params)
+    return dict(cursor.fetchall())
+
+def upsert_changed_rows(cursor, table_name, columns, rows, existing_hashes, fetched_at, touch_unchanged=True):
+    """Write only rows whose content changed, returning (changed, unchanged) row counts.
+
+    columns/rows start with the primary key and exclude content_hash and fetched_at.
+    Unchanged rows get fetched_at touched if touch_unchanged, and are otherwise
+    not written at all.
+    """
+    key_field = columns[0]
+    changed, unchanged = [], []
+    for row in rows:
+        row_hash = content_hash(row)
+        if existing_hashes.get(row[0]) == row_hash:
+            unchanged.append((fetched_at, row[0]))
+        else:
+            changed.append(tuple(row) + (row_hash, fetched_at))
+    if unchanged and touch_unchanged:
+        cursor.executemany(f'UPDATE {table_name} SET fetched_at = ? WHERE {key_field} = ?', unchanged)
+    if changed:
+        all_columns = list(columns) + ['content_hash', 'fetched_at']
+        updates = ', '.join(f'{column} = excluded.{column}' for column in all_columns[1:])
+        cursor.executemany(f'''
+            INSERT INTO {table_name} ({', '.join(all_columns)})
+            VALUES ({', '.join('?' * len(all_columns))})
+            ON CONFLICT({key_field}) DO UPDATE SET {updates}
+        ''', changed)
+    return len(changed), len(unchanged)
+
+def save_channel_info(channel_info):
+    """Save channel info to database, skipping the rewrite if nothing changed."""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    try:
+        existing_hashes = load_content_hashes(cursor, "Channel_Info", "channel_id", "channel_id = ?", (channel_info["channel_id"],))
+        changed, _ = upsert_changed_rows(cursor, "Channel_Info", [
+            "channel_id", "channel_title", "subscribers", "total_views", "joined_date",
+            "total_videos", "origin", "channel_description", "description_links", "monetized"
+        ], [(
+            channel_info["channel_id"],
+            channel_info["channel_title"],
+            channel_info["subscribers"],
+            channel_info["totalviews"],
+            channel_info["joined_date"],
+            channel_info["total_videos"],
+            channel_info["origin"],
+            channel_info["channel_description"],
+            channel_info["descriptionlinks"],
+            channel_info["monitized"]
+        )], existing_hashes, channel_info["fetched_at"])
+        conn.commit()
+        logger.info(f"Channel info {'saved to' if changed else 'unchanged in'} database for {channel_info['channel_title']}")
+    except Exception as e:
+        logger.error(f"Error saving channel info to database: {e}")
+    finally:
+        conn.close()
+
+@staged("save_video_or_short", track_allocations=True)
+def save_video_or_short(content_type, item, channel_id):
+    """Save video or short to database, rewriting only rows whose content changed.
+
+    The video/short's fetched_at records when it was last seen; comment and reply
+    rows keep the time they were last written, so unchanged ones cost no writes.
+    The channel aggregate tables are updated in the same transaction.
+    """
+    table_name = "Videos" if content_type == "videos" else "Shorts"
+    id_field = "video_id" if content_type == "videos" else "short_id"
+    video_id = item.get("video_id", str(uuid.uuid4()))
+    fetched_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    try:
+        # Take the write lock before reading the old state the stats delta is based on
+        cursor.execute("BEGIN IMMEDIATE")
+        cursor.execute(f'''
+            SELECT channel_id, views, likes, duration, upload_date FROM {table_name} WHERE {id_field} = ?
+        ''', (video_id,))
+        old_row = cursor.fetchone()
+        existing_hashes = load_content_hashes(cursor, table_name, id_field, f"{id_field} = ?", (video_id,))
+        changed, _ = upsert_changed_rows(cursor, table_name, [
+            id_field, "channel_id", "title", "description", "views", "duration",
+            "upload_date", "likes", "comment_count"
+        ], [(
+            video_id,
+            channel_id,
+            item["title"],
+            item["description"],
+            item["views"],
+            item["duration"],
+            item["upload_date"],
+            item["likes"],
+            item["comment_count"]
+        )], existing_hashes, fetched_at)
+        logger.info(f"{'Saved' if changed else 'Unchanged'} {content_type[:-1]} {item['title'][:50]}... {'to' if changed else 'in'} database")
+
+        # Save comments and replies, leaving unchanged rows untouched
+        comments_table = "Videos_Comments" if content_type == "videos" else "Shorts_Comments"
+        replies_table = "Videos_Replies" if content_type == "videos" else "Shorts_Replies"
+        comment_hashes = load_content_hashes(cursor, comments_table, "comment_id", f"{id_field} = ?", (video_id,))
+        reply_hashes = load_content_hashes(
+            cursor, replies_table, "reply_id",
+            f"comment_id IN (SELECT comment_id FROM {comments_table} WHERE {id_field} = ?)", (video_id,)
+        )
+        comments_changed, comments_unchanged = upsert_changed_rows(cursor, comments_table, [
+            "comment_id", id_field, "text", "author", "channel_id", "timestamp"
+        ], [(
+            comment["comment_id"],
+            video_id,
+            comment["text"],
+            comment["author"],
+            comment["channel_id"],
+            comment["timestamp"]
+        ) for comment in item["comments"]], comment_hashes, fetched_at, touch_unchanged=False)
+        replies_changed, replies_unchanged = upsert_changed_rows(cursor, replies_table, [
+            "reply_id", "comment_id", "text", "author", "timestamp"
+        ], [(
+            reply["reply_id"],
+            comment["comment_id"],
+            reply["text"],
+            reply["author"],
+            reply["timestamp"]
+        ) for comment in item["comments"] for reply in comment["replies"]], reply_hashes, fetched_at, touch_unchanged=False)
+
+        # Keep the channel aggregates in step with what is now stored
+        comment_ids = set(comment_hashes) | {comment["comment_id"] for comment in item["comments"]}
+        reply_ids = set(reply_hashes) | {reply["reply_id"] for comment in item["comments"] for reply in comment["replies"]}
+        old_contribution = stats.stats_contribution(*old_row, len(comment_hashes), len(reply_hashes)) if old_row else None
+        new_contribution = stats.stats_contribution(
+            channel_id, item["views"], item["likes"], item["duration"], item["upload_date"],
+            len(comment_ids), len(reply_ids)
+        )
+        stats.update_stats(cursor, content_type, old_contribution, new_contribution)
+        conn.commit()
+        logger.info(f"Saved {comments_changed + comments_unchanged} comments ({comments_unchanged} unchanged) and {replies_changed + replies_unchanged} replies ({replies_unchanged} unchanged) for {content_type[:-1]} {video_id}")
+    except Exception as e:
+        conn.rollback()
+        logger.error(f"Error saving {content_type[:-1]} to database: {e}")
+    finally:
+        conn.close()
+    return video_id
+
+def load_known_items(content_type, item_ids):
+    """Load views, upload date and fetch time of the given videos/shorts that are already stored."""
+    table_name = "Videos" if content_type == "videos" else "Shorts"
+    id_field = "video_id" if content_type == "videos" else "short_id"
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    known = {}
+    try:
+        item_ids = list(item_ids)
+        for start in range(0, len(item_ids), LOOKUP_CHUNK_SIZE):
+            chunk = item_ids[start:start + LOOKUP_CHUNK_SIZE]
+            cursor.execute(f'''
+                SELECT {id_field}, views, upload_date, fetched_at FROM {table_name}
+                WHERE {id_field} IN ({', '.join('?' * len(chunk))})
+            ''', chunk)
+            for row in cursor.fetchall():
+                known[row[0]] = {"views": row[1], "upload_date": row[2], "fetched_at": row[3]}
+    except Exception as e:
+        logger.error(f"Error loading known {content_type} from database: {e}")
+    finally:
+        conn.close()
+    return known
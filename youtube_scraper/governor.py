@@ -0,0 +1,135 @@
+import asyncio
+import logging
+import threading
+
+from .utils import memory_usage_mb
+
+logger = logging.getLogger(__name__)
+
+class MemoryGovernor:
+    """Concurrency limiter that backs off as memory use approaches a budget.
+
+    Works like the asyncio.Semaphore it replaces, but samples memory (RSS by
+    default) on every acquire. Callers acquire before submitting work, so a
+    paused governor holds back the producer too. With a budget the limit
+    starts at one slot and grows as tasks finish: doubling while memory is
+    below the low-water mark, and by one slot while it is below the budget and
+    not rising. On reaching memory_budget_mb the limit is halved and new work
+    is paused until memory falls below the low-water mark or all running work
+    has finished, since RSS is rarely handed back to the OS. One task is always
+    allowed to run so a run cannot stall. Jobs handed to hold_until_done keep
+    their slot until their thread finishes.
+    """
+
+    def __init__(self, max_concurrency, memory_budget_mb=None, low_water_ratio=0.8,
+                 poll_interval=0.5, rss_fn=memory_usage_mb):
+        self.max_concurrency = max_concurrency
+        self.limit = 1 if memory_budget_mb else max_concurrency
+        self.memory_budget_mb = memory_budget_mb
+        self.low_water_mb = memory_budget_mb * low_water_ratio if memory_budget_mb else None
+        self.poll_interval = poll_interval
+        self.rss_fn = rss_fn
+        self.active = 0
+        self.orphaned = 0
+        self._orphan_lock = threading.Lock()
+        self.paused = False
+        self.pauses = 0
+        self.peak_active = 0
+        self.peak_usage_mb = 0.0
+        self._last_release_mb = None
+        self._condition = None
+
+    @property
+    def condition(self):
+        # Created lazily so the governor can be built outside a running loop
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    def usage_mb(self):
+        """Current memory use as seen by the governor."""
+        usage = self.rss_fn() if self.rss_fn else 0.0
+        self.peak_usage_mb = max(self.peak_usage_mb, usage)
+        return usage
+
+    def running(self):
+        return self.active + self.orphaned
+
+    def update(self):
+        """Sample memory and pause or resume new work."""
+        if not self.memory_budget_mb:
+            return
+        usage = self.usage_mb()
+        if usage >= self.memory_budget_mb:
+            if not self.paused:
+                new_limit = max(1, (min(self.limit, self.running()) or self.limit) // 2)
+                logger.warning(f"Memory {usage:.0f} MB over budget {self.memory_budget_mb:.0f} MB, "
+                               f"pausing new work and lowering concurrency {self.limit} -> {new_limit}")
+                self.paused = True
+                self.pauses += 1
+                self.limit = new_limit
+        elif self.paused and (usage <= self.low_water_mb or self.running() == 0):
+            logger.info(f"Memory {usage:.0f} MB, {self.running()} tasks running, resuming at concurrency {self.limit}")
+            self.paused = False
+
+    def grow(self):
+        """Raise the limit after a task finishes if memory allows it."""
+        if not self.memory_budget_mb or self.paused:
+            return
+        usage = self.usage_mb()
+        if usage <= self.low_water_mb:
+            self.limit = min(self.max_concurrency, self.limit * 2)
+        elif usage < self.memory_budget_mb and self._last_release_mb is not None and usage <= self._last_release_mb:
+            # Freed memory is being reused rather than RSS still climbing
+            self.limit = min(self.max_concurrency, self.limit + 1)
+        self._last_release_mb = usage
+
+    def can_start(self):
+        """Whether another task may start now."""
+        if self.running() == 0:
+            return True
+        return not self.paused and self.running() < self.limit
+
+    async def acquire(self):
+        async with self.condition:
+            self.update()
+            while not self.can_start():
+                await self._wait()
+            self.active += 1
+            self.peak_active = max(self.peak_active, self.active)
+
+    async def release(self):
+        async with self.condition:
+            self.active -= 1
+            self.grow()
+            self.condition.notify_all()
+
+    async def _wait(self):
+        """Wait for a release, re-sampling memory at least every poll_interval."""
+        try:
+            await asyncio.wait_for(self.condition.wait(), timeout=self.poll_interval)
+        except asyncio.TimeoutError:
+            pass
+        self.update()
+
+    def hold_until_done(self, future):
+        """Keep a slot taken by a timed-out job whose thread is still running.
+
+        future is the executor's concurrent.futures.Future; waiting tasks see
+        the slot free up on their next poll.
+        """
+        with self._orphan_lock:
+            self.orphaned += 1
+        future.add_done_callback(self._orphan_done)
+
+    def _orphan_done(self, future):
+        with self._orphan_lock:
+            self.orphaned -= 1
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.release()
+
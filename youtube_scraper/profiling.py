@@ -0,0 +1,199 @@
+"""Opt-in profiling: per-stage CPU/wall time, allocations and a cProfile report.
+
+Everything here is a no-op until enable_profiling() is called (the CLI does so
+for --profile), so the stage() markers left in the scraping code cost almost
+nothing in normal runs. cProfile, pstats and tracemalloc are only imported
+once profiling is enabled.
+"""
+import contextlib
+import functools
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+TRACEMALLOC_FRAMES = 10
+ALLOCATION_SAMPLES = 5  # Calls per stage diffed with full tracemalloc snapshots
+_state = None
+_lock = threading.Lock()
+_NULL_STAGE = contextlib.nullcontext()
+
+def enable_profiling(output_dir=".", trace_allocations=True):
+    """Start collecting stage timings, a cProfile profile and (optionally) allocations."""
+    global _state
+    import cProfile
+    import tracemalloc
+    if _state is not None:
+        return
+    if trace_allocations and not tracemalloc.is_tracing():
+        tracemalloc.start(TRACEMALLOC_FRAMES)
+    profiler = cProfile.Profile()
+    _state = {
+        "output_dir": output_dir,
+        "trace_allocations": trace_allocations,
+        "started_at": time.perf_counter(),
+        "profiler": profiler,
+        "stages": {},
+        "allocation_sites": {}
+    }
+    profiler.enable()
+    logger.info(f"Profiling enabled (allocations: {'on' if trace_allocations else 'off'})")
+
+class _Stage:
+    """Times one pass through a stage and adds it to the stage totals.
+
+    Holds on to the profiling state it started with, so a stage that ends after
+    the report was written (e.g. a timed-out extraction) exits quietly.
+    """
+
+    def __init__(self, name, track_allocations):
+        import tracemalloc
+        self.state = _state
+        self.tracemalloc = tracemalloc
+        self.name = name
+        self.track_allocations = track_allocations and tracemalloc.is_tracing()
+
+    def __enter__(self):
+        # Snapshot first so taking it is not counted in the stage's own time
+        self.snapshot = None
+        if self.track_allocations and threading.current_thread() is threading.main_thread():
+            with _lock:
+                sites = self.state["allocation_sites"].setdefault(self.name, {"samples": 0, "sizes": {}})
+                sample = sites["samples"] < ALLOCATION_SAMPLES
+                sites["samples"] += sample
+            if sample:
+                self.state["profiler"].disable()
+                self.snapshot = self.take_snapshot()
+                self.state["profiler"].enable()
+        self.memory = self.tracemalloc.get_traced_memory()[0] if self.track_allocations else 0
+        self.wall = time.perf_counter()
+        self.cpu = time.thread_time()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        wall = time.perf_counter() - self.wall
+        cpu = time.thread_time() - self.cpu
+        allocated = self.tracemalloc.get_traced_memory()[0] - self.memory if self.track_allocations else 0
+        with _lock:
+            totals = self.state["stages"].setdefault(self.name, {"calls": 0, "wall": 0.0, "cpu": 0.0, "allocated": 0})
+            totals["calls"] += 1
+            totals["wall"] += wall
+            totals["cpu"] += cpu
+            totals["allocated"] += allocated
+        if self.snapshot is not None:
+            sizes = self.state["allocation_sites"][self.name]["sizes"]
+            self.state["profiler"].disable()
+            for diff in self.take_snapshot().compare_to(self.snapshot, "lineno")[:20]:
+                if diff.size_diff > 0:
+                    site = str(diff.traceback[0])
+                    sizes[site] = sizes.get(site, 0) + diff.size_diff
+            self.state["profiler"].enable()
+        return False
+
+    def take_snapshot(self):
+        """Snapshot traced memory, leaving out the profiler's own allocations."""
+        return self.tracemalloc.take_snapshot().filter_traces(snapshot_filters(self.tracemalloc))
+
+def snapshot_filters(tracemalloc):
+    return [
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+    ]
+
+def stage(name, track_allocations=False):
+    """Context manager marking a pipeline stage; does nothing unless profiling is enabled."""
+    if _state is None:
+        return _NULL_STAGE
+    return _Stage(name, track_allocations)
+
+def staged(name, track_allocations=False):
+    """Decorator running every call of the function as stage(name)."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _state is None:
+                return func(*args, **kwargs)
+            with _Stage(name, track_allocations):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def profiled_call(stage_name, func, *args, **kwargs):
+    """Call func as stage_name, e.g. from an executor thread.
+
+    Only the stage totals cover work run this way: cProfile follows the main
+    thread alone, and since Python 3.12 a second profiler cannot be started
+    while it is active.
+    """
+    if _state is None:
+        return func(*args, **kwargs)
+    with stage(stage_name):
+        return func(*args, **kwargs)
+
+def format_stage_table(stages, total_wall):
+    lines = [f"{'stage':<28}{'calls':>8}{'wall s':>11}{'cpu s':>11}{'% wall':>9}{'~alloc MB':>15}"]
+    for name, totals in sorted(stages.items(), key=lambda item: item[1]["wall"], reverse=True):
+        share = 100 * totals["wall"] / total_wall if total_wall else 0
+        lines.append(f"{name:<28}{totals['calls']:>8}{totals['wall']:>11.3f}{totals['cpu']:>11.3f}"
+                     f"{share:>9.1f}{totals['allocated'] / 1024**2:>15.2f}")
+    return lines
+
+def write_profile_report(top=30):
+    """Stop profiling and write a text report plus a .prof file, returning the report path."""
+    global _state
+    import io
+    import pstats
+    import tracemalloc
+    if _state is None:
+        return None
+    state, _state = _state, None
+    state["profiler"].disable()
+    total_wall = time.perf_counter() - state["started_at"]
+
+    # Snapshot before building the pstats report so its allocations are not included
+    snapshot = None
+    if state["trace_allocations"] and tracemalloc.is_tracing():
+        current, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot().filter_traces(snapshot_filters(tracemalloc))
+        tracemalloc.stop()
+
+    stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    os.makedirs(state["output_dir"], exist_ok=True)
+    report_file = os.path.join(state["output_dir"], f"youtube_scraper_profile_{stamp}.txt")
+    stats_file = os.path.join(state["output_dir"], f"youtube_scraper_profile_{stamp}.prof")
+
+    stats = pstats.Stats(state["profiler"])
+    stats.dump_stats(stats_file)
+
+    lines = [f"Profile of run taking {total_wall:.2f} seconds", "",
+             "Stages (inclusive; extract_info runs in worker threads and overlaps other stages)"]
+    lines += format_stage_table(state["stages"], total_wall)
+    if state["trace_allocations"]:
+        lines.append("~alloc MB is the process-wide change in traced memory while the stage ran, so it also "
+                     "counts allocations made meanwhile by extraction threads")
+
+    for sort_key in ("cumulative", "tottime"):
+        buffer = io.StringIO()
+        stats.stream = buffer
+        stats.sort_stats(sort_key).print_stats(top)
+        lines += ["", f"Top {top} main-thread functions by {sort_key} time", buffer.getvalue().strip()]
+
+    if snapshot is not None:
+        for name, sites in state["allocation_sites"].items():
+            lines += ["", f"Top allocation sites during {name} (process-wide, sampled over {min(sites['samples'], ALLOCATION_SAMPLES)} calls)"]
+            for site, size in sorted(sites["sizes"].items(), key=lambda item: item[1], reverse=True)[:top]:
+                lines.append(f"  {size / 1024:11.1f} KB  {site}")
+        lines += ["", f"Traced memory: {current / 1024**2:.2f} MB live, {peak / 1024**2:.2f} MB peak",
+                  f"Top {top} allocation sites still live at the end of the run"]
+        for stat in snapshot.statistics("lineno")[:top]:
+            lines.append(f"  {stat.size / 1024**2:9.2f} MB {stat.count:>9} blocks  {stat.traceback[0]}")
+
+    with open(report_file, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(lines) + '\n')
+    logger.info(f"Profile report saved to {report_file} (pstats data: {stats_file})")
+    return report_file
+
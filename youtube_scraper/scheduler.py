@@ -0,0 +1,79 @@
+import logging
+import time
+from datetime import datetime as dt
+
+from . import config
+from .db import load_known_items
+
+logger = logging.getLogger(__name__)
+
+def new_run_budget(max_seconds=None, max_requests=None):
+    """Create a wall-clock/request budget shared by every scraping pass in a run.
+
+    Limits left as None are taken from config when the budget is created.
+    """
+    return {
+        "max_seconds": config.RUN_TIME_BUDGET if max_seconds is None else max_seconds,
+        "max_requests": config.RUN_REQUEST_BUDGET if max_requests is None else max_requests,
+        "started_at": time.time(),
+        "requests_used": 0
+    }
+
+def budget_exhausted(budget):
+    """Check whether the run budget has been spent."""
+    if budget is None:
+        return False
+    if budget["max_seconds"] is not None and time.time() - budget["started_at"] >= budget["max_seconds"]:
+        return True
+    return budget["max_requests"] is not None and budget["requests_used"] >= budget["max_requests"]
+
+def take_from_budget(budget, entries):
+    """Reserve one extraction per entry and return the entries the budget allows."""
+    if budget is None:
+        return entries
+    if budget_exhausted(budget):
+        return []
+    if budget["max_requests"] is not None:
+        entries = entries[:budget["max_requests"] - budget["requests_used"]]
+    budget["requests_used"] += len(entries)
+    return entries
+
+def priority_recency(entry, known):
+    """Newest uploads first; items never stored are treated as newest."""
+    if entry.get('timestamp'):
+        return float(entry['timestamp'])
+    upload_date = entry.get('upload_date') or (known or {}).get('upload_date')
+    try:
+        return dt.strptime(upload_date.replace('-', ''), '%Y%m%d').timestamp()
+    except (AttributeError, ValueError):
+        return float('inf')
+
+def priority_views(entry, known):
+    """Most viewed first, using the playlist or last stored view count."""
+    views = entry.get('view_count')
+    if views is None and known:
+        views = known.get('views')
+    return float('inf') if views is None else views
+
+def priority_staleness(entry, known):
+    """Least recently fetched first; items never stored go first."""
+    try:
+        return time.time() - dt.strptime(known['fetched_at'], '%Y-%m-%d %H:%M:%S').timestamp()
+    except (TypeError, KeyError, ValueError):
+        return float('inf')
+
+PRIORITY_FUNCTIONS = {
+    "recency": priority_recency,
+    "views": priority_views,
+    "staleness": priority_staleness,
+}
+
+def prioritize_entries(entries, content_type, priority):
+    """Order playlist entries by descending priority, keeping playlist order for ties.
+
+    Returns (playlist position, entry) pairs so progress can still be recorded
+    as a position in the playlist.
+    """
+    priority_fn = PRIORITY_FUNCTIONS[priority] if isinstance(priority, str) else priority
+    known = load_known_items(content_type, [entry['id'] for entry in entries if entry.get('id')])
+    return sorted(enumerate(entries), key=lambda item: priority_fn(item[1], known.get(item[1].get('id'))), reverse=True)
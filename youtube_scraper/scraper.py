@@ -0,0 +1,394 @@
+import asyncio
+import concurrent.futures
+import hashlib
+import json
+import logging
+import time
+import traceback
+import uuid
+from datetime import datetime
+
+from . import config
+from .channel import scrape_channel_info_selenium
+from .checkpoint import load_checkpoint, save_checkpoint
+from .db import init_database, load_channel_info, save_channel_info, save_video_or_short
+from .governor import MemoryGovernor
+from .profiling import profiled_call, stage, staged
+from .scheduler import budget_exhausted, new_run_budget, prioritize_entries, take_from_budget
+from .utils import memory_usage_mb, parse_timestamp, sanitize_filename, sanitize_log_message
+
+logger = logging.getLogger(__name__)
+
+async def fetch_page(session, url, retries=config.RETRY_LIMIT):
+    """Fetch a page asynchronously with retry logic."""
+    for attempt in range(retries):
+        try:
+            async with session.get(url, timeout=config.TIMEOUT) as response:
+                if response.status == 200:
+                    return await response.text()
+                logger.warning(f"Failed to fetch {url}, status: {response.status}, attempt: {attempt + 1}")
+        except Exception as e:
+            logger.error(f"Error fetching {url}: {e}, attempt: {attempt + 1}")
+        await asyncio.sleep(1 * (attempt + 1))
+    logger.error(f"Failed to fetch {url} after {retries} attempts")
+    return None
+
+async def scrape_videos_shorts(channel_url, content_type, session, channel_id, start_index=0, checkpoint_data=None,
+                               priority=None, budget=None, governor=None):
+    """Scrape videos or shorts using yt-dlp with checkpoint and database support.
+
+    priority defaults to config.PRIORITY. With "playlist" priority entries are processed in upload order from
+    start_index. Any other priority (a PRIORITY_FUNCTIONS name or a callable taking
+    (entry, known_row)) ranks every entry, stored ones included so they can be
+    refreshed, and processes them highest priority first; use a budget to limit
+    how many. Processing stops cleanly once budget is spent. The checkpoint's
+    processed count stays a playlist position: every entry before it is done.
+    Extractions are limited by governor, a MemoryGovernor built from config if
+    not given, and run in a thread pool of the governor's maximum size.
+    """
+    logger.info(f"Starting {content_type} scraping for {channel_url} from index {start_index}")
+    start_time = time.time()
+    priority = priority or config.PRIORITY
+    url = f"{channel_url}/{content_type}"
+    data = {"total": 0, content_type: []}
+    metadata_cache = {}
+    checkpoint_data = checkpoint_data or {
+        "videos": [],
+        "shorts": [],
+        "channel_info_scraped": False,
+        "videos_processed": 0,
+        "shorts_processed": 0
+    }
+
+    if budget_exhausted(budget):
+        logger.info(f"Run budget exhausted, skipping {content_type}")
+        return data, checkpoint_data
+
+    import yt_dlp
+    governor = governor or MemoryGovernor(
+        config.MAX_CONCURRENT_REQUESTS, config.MEMORY_BUDGET_MB, config.MEMORY_LOW_WATER_RATIO
+    )
+    # Sized to the concurrency limit so extractions never queue behind each other
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=governor.max_concurrency,
+                                                     thread_name_prefix=f"{content_type}_extract")
+    with yt_dlp.YoutubeDL(config.YDL_OPTS) as ydl:
+        try:
+            logger.info(f"Fetching playlist info for {content_type}")
+            with stage("playlist_fetch"):
+                info = ydl.extract_info(url, download=False)
+            entries = info.get('entries', []) or []
+            data["total"] = len(entries)
+            logger.info(f"Found {data['total']} {content_type}")
+
+            # Items saved out of playlist order by a priority run count as done too
+            checkpoint_index = {item.get("video_id"): i for i, item in enumerate(checkpoint_data[content_type])}
+            progress = {
+                "next_position": start_index,
+                "finished": {position for position, entry in enumerate(entries)
+                             if position >= start_index and entry.get('id') in checkpoint_index},
+                "completed": 0
+            }
+            advance_checkpoint_position(progress)
+
+            if priority == "playlist":
+                candidates = [(position, entry) for position, entry in enumerate(entries)
+                              if position >= progress["next_position"] and position not in progress["finished"]]
+                logger.info(f"Processing {len(candidates)} {content_type} starting from index {progress['next_position']}")
+            else:
+                candidates = prioritize_entries(entries, content_type, priority)
+                logger.info(f"Ranking {len(candidates)} {content_type} by {getattr(priority, '__name__', priority)} priority")
+
+            # Results are saved as soon as they finish; unless comments are exported
+            # only a summary of each is kept for the JSON export
+            keep_comments = config.EXPORT_COMMENTS
+            if keep_comments and governor.memory_budget_mb:
+                logger.warning("Comments are held in memory for the JSON export despite the memory budget; "
+                               "use --no-export-comments to keep them in the database only")
+
+            def finish(position):
+                if position >= progress["next_position"]:
+                    progress["finished"].add(position)
+                advance_checkpoint_position(progress)
+                progress["completed"] += 1
+                if progress["completed"] % config.CHECKPOINT_INTERVAL == 0:
+                    checkpoint()
+
+            def checkpoint():
+                if checkpoint_data.get('channel_info'):
+                    checkpoint_data[f'{content_type}_processed'] = progress["next_position"]
+                    save_checkpoint(channel_id, checkpoint_data)
+
+            async def run_entry(position, entry):
+                """Extract and save one video/short, then give back its governor slot."""
+                idx = position + 1
+                video_url = entry['url']
+                try:
+                    result = await process_video(session, video_url, entry, idx, data['total'], content_type,
+                                                 metadata_cache, executor, governor)
+                    if result:
+                        video_id = save_video_or_short(content_type, result, channel_id)
+                        result["video_id"] = video_id
+                        summary = summarize_result(result)
+                        data[content_type].append(result if keep_comments else summary)
+                        if video_id in checkpoint_index:
+                            checkpoint_data[content_type][checkpoint_index[video_id]] = summary
+                        else:
+                            checkpoint_index[video_id] = len(checkpoint_data[content_type])
+                            checkpoint_data[content_type].append(summary)
+                        logger.info(f"Processed {content_type[:-1]} {idx}/{data['total']}: {sanitize_log_message(result['title'][:50])}... | Comments: {len(result['comments'])}")
+                    else:
+                        logger.warning(f"Skipped {content_type[:-1]} {idx}/{data['total']}: No data returned")
+                except asyncio.TimeoutError:
+                    logger.error(f"Task for {content_type} timed out after {config.TASK_TIMEOUT} seconds")
+                except Exception as e:
+                    logger.error(f"Error in {content_type[:-1]} {idx}/{data['total']}: {e}")
+                finally:
+                    # Raw yt-dlp info (including full comment lists) is not needed once saved
+                    metadata_cache.pop(video_url, None)
+                    finish(position)
+                    await governor.release()
+
+            tasks = []
+            for position, entry in candidates:
+                if not entry.get('url'):
+                    finish(position)
+                    continue
+                # Waiting here holds back submission, not just the start of queued work
+                await governor.acquire()
+                if not take_from_budget(budget, [entry]):
+                    await governor.release()
+                    logger.info(f"Run budget exhausted, stopping {content_type} after queueing {len(tasks)} items")
+                    break
+                logger.info(f"Queueing {content_type[:-1]} {position + 1}/{data['total']}: {entry['url']}")
+                tasks.append(asyncio.ensure_future(run_entry(position, entry)))
+            await asyncio.gather(*tasks)
+            checkpoint()
+
+        except Exception as e:
+            logger.error(f"Error scraping {content_type}: {e}\n{traceback.format_exc()}")
+        finally:
+            # Timed-out extractions cannot be interrupted; let them finish in the background
+            executor.shutdown(wait=False)
+
+    logger.info(f"{content_type.capitalize()} scraping completed in {time.time() - start_time:.2f} seconds")
+    if governor.memory_budget_mb:
+        logger.info(f"Memory governor: peak {governor.peak_usage_mb:.2f} MB, peak concurrency {governor.peak_active}, "
+                    f"paused {governor.pauses} times, final limit {governor.limit}")
+    logger.info(f"Memory usage: {memory_usage_mb():.2f} MB")
+    return data, checkpoint_data
+
+def advance_checkpoint_position(progress):
+    """Move the playlist position past every finished entry up to the first one still to do."""
+    while progress["next_position"] in progress["finished"]:
+        progress["finished"].remove(progress["next_position"])
+        progress["next_position"] += 1
+
+def summarize_result(result):
+    """A saved video/short without its comments, which are kept in the database only."""
+    summary = {key: value for key, value in result.items() if key != 'comments'}
+    summary['comments_saved'] = len(result['comments'])
+    return summary
+
+@staged("normalize_comments", track_allocations=True)
+def normalize_comments(raw_comments):
+    """Turn yt-dlp's flat comment list into top-level comments with nested replies."""
+    comments = []
+    comment_map = {}
+    for comment in raw_comments:
+        comment_id = comment.get('id', str(uuid.uuid4()))
+        parent_id = comment.get('parent')
+        comment_data = {
+            'comment_id': comment_id,
+            'text': comment.get('text', 'N/A'),
+            'author': comment.get('author', 'Unknown'),
+            'channel_id': comment.get('channel_id', 'N/A'),
+            'timestamp': parse_timestamp(comment.get('timestamp', 'N/A')),
+            'replies': []
+        }
+        comment_map[comment_id] = comment_data
+        if not parent_id or parent_id == 'root':
+            comments.append(comment_data)
+        else:
+            parent_comment = comment_map.get(parent_id)
+            if parent_comment:
+                parent_comment['replies'].append({
+                    'reply_id': comment_id,
+                    'text': comment.get('text', 'N/A'),
+                    'author': comment.get('author', 'Unknown'),
+                    'timestamp': parse_timestamp(comment.get('timestamp', 'N/A'))
+                })
+            else:
+                logger.warning(f"Orphan reply {comment_id} for parent {parent_id}, treating as comment")
+                comments.append(comment_data)
+    return comments
+
+async def run_in_worker(executor, timeout, governor, func, *args, **kwargs):
+    """Run a blocking call in executor, timing out only once it has started running.
+
+    A timed-out call cannot be stopped, so its thread keeps its governor slot
+    until it ends.
+    """
+    loop = asyncio.get_running_loop()
+    started = loop.create_future()
+
+    def job():
+        loop.call_soon_threadsafe(lambda: started.done() or started.set_result(None))
+        return func(*args, **kwargs)
+
+    job_future = executor.submit(job)
+    try:
+        await started
+    except asyncio.CancelledError:
+        job_future.cancel()
+        raise
+    try:
+        return await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(job_future)), timeout=timeout)
+    except asyncio.TimeoutError:
+        if governor is not None:
+            governor.hold_until_done(job_future)
+        raise
+
+async def process_video(session, video_url, entry, idx, total, content_type, metadata_cache, executor, governor=None):
+    """Process a single video/short with metadata and comments.
+
+    Each extraction attempt may take up to config.TASK_TIMEOUT seconds once it is
+    running; a timeout is raised to the caller rather than retried.
+    """
+    logger.info(f"Processing {content_type[:-1]} {idx}/{total}: {video_url}")
+    import yt_dlp
+    try:
+        with yt_dlp.YoutubeDL(config.YDL_OPTS) as ydl:
+            for attempt in range(config.RETRY_LIMIT):
+                try:
+                    logger.debug(f"Attempt {attempt + 1}/{config.RETRY_LIMIT} to fetch {video_url}")
+                    # Run the blocking extraction off the event loop so tasks really overlap
+                    info = await run_in_worker(executor, config.TASK_TIMEOUT, governor, profiled_call,
+                                               "extract_info", ydl.extract_info, video_url, download=False)
+                    if not info:
+                        logger.warning(f"No info returned for {video_url}")
+                        return None
+                    metadata_cache[video_url] = info
+                    break
+                except asyncio.TimeoutError:
+                    raise
+                except Exception as e:
+                    logger.warning(f"Attempt {attempt + 1}/{config.RETRY_LIMIT} failed for {video_url}: {e}")
+                    if attempt + 1 == config.RETRY_LIMIT:
+                        logger.error(f"Failed to process {video_url} after {config.RETRY_LIMIT} attempts")
+                        return None
+                    await asyncio.sleep(1 * (attempt + 1))
+
+        comments = normalize_comments(info.get('comments', []))
+        logger.info(f"Processed {len(comments)} comments with {sum(len(c['replies']) for c in comments)} replies for {video_url}")
+
+        return {
+            'video_id': info.get('id', str(uuid.uuid4())),
+            'title': info.get('title', entry.get('title', 'N/A')),
+            'description': info.get('description', '') if content_type != "shorts" else info.get('title', ''),
+            'views': info.get('view_count', 0),
+            'duration': info.get('duration', 0),
+            'upload_date': datetime.strptime(info.get('upload_date', '19700101'), '%Y%m%d').strftime('%Y-%m-%d') if info.get('upload_date') else 'N/A',
+            'likes': info.get('like_count', 0),
+            'comment_count': info.get('comment_count', 0),
+            'comments': comments
+        }
+    except asyncio.TimeoutError:
+        raise
+    except Exception as e:
+        logger.error(f"Error processing {content_type[:-1]} {idx}/{total} ({video_url}): {e}\n{traceback.format_exc()}")
+        return None
+
+async def scrape_channel(channel_url, priority=None, time_budget=None, request_budget=None):
+    """Scrape channel data with checkpoints and database storage.
+
+    priority and the budgets default to the config values at call time.
+    """
+    import aiohttp
+    start_time = time.time()
+    budget = new_run_budget(time_budget, request_budget)
+    governor = MemoryGovernor(config.MAX_CONCURRENT_REQUESTS, config.MEMORY_BUDGET_MB, config.MEMORY_LOW_WATER_RATIO)
+    logger.info(f"Starting scraping for channel: {channel_url}")
+    logger.info(f"Initial memory usage: {memory_usage_mb():.2f} MB")
+
+    # Initialize database
+    init_database()
+
+    # Generate channel_id from URL
+    channel_id = hashlib.md5(channel_url.encode()).hexdigest()
+    checkpoint_data = {
+        "videos": [],
+        "shorts": [],
+        "channel_info_scraped": False,
+        "videos_processed": 0,
+        "shorts_processed": 0
+    }
+    
+    # Load checkpoint
+    loaded_checkpoint = load_checkpoint(channel_id)
+    checkpoint_data.update(loaded_checkpoint)
+    
+    # Load or scrape channel info
+    if checkpoint_data.get("channel_info_scraped", False):
+        channel_info = load_channel_info(channel_id)
+        if channel_info:
+            logger.info("Loaded existing channel info from database")
+            checkpoint_data["channel_info"] = channel_info
+        else:
+            logger.info("Channel info checkpoint exists but not in database, re-scraping")
+            selenium_start = time.time()
+            with concurrent.futures.ThreadPoolExecutor() as executor:
+                channel_info_future = executor.submit(scrape_channel_info_selenium, channel_url)
+                channel_info = channel_info_future.result()
+            save_channel_info(channel_info)
+            checkpoint_data["channel_info"] = channel_info
+            checkpoint_data["channel_info_scraped"] = True
+            save_checkpoint(channel_id, checkpoint_data)
+            logger.info(f"Selenium scraping took {time.time() - selenium_start:.2f} seconds")
+    else:
+        selenium_start = time.time()
+        channel_info = scrape_channel_info_selenium(channel_url)
+        save_channel_info(channel_info)
+        checkpoint_data["channel_info"] = channel_info
+        checkpoint_data["channel_info_scraped"] = True
+        save_checkpoint(channel_id, checkpoint_data)
+        logger.info(f"Selenium scraping took {time.time() - selenium_start:.2f} seconds")
+
+    async with aiohttp.ClientSession() as session:
+        logger.info("Starting concurrent video and shorts scraping")
+        video_start = time.time()
+        videos_data, checkpoint_data = await scrape_videos_shorts(
+            channel_url, "videos", session, channel_id,
+            start_index=checkpoint_data.get("videos_processed", 0),
+            checkpoint_data=checkpoint_data,
+            priority=priority,
+            budget=budget,
+            governor=governor
+        )
+        logger.info(f"Video scraping took {time.time() - video_start:.2f} seconds")
+        
+        shorts_start = time.time()
+        shorts_data, checkpoint_data = await scrape_videos_shorts(
+            channel_url, "shorts", session, channel_id,
+            start_index=checkpoint_data.get("shorts_processed", 0),
+            checkpoint_data=checkpoint_data,
+            priority=priority,
+            budget=budget,
+            governor=governor
+        )
+        logger.info(f"Shorts scraping took {time.time() - shorts_start:.2f} seconds")
+
+    combined_data = {
+        "channel_info": channel_info,
+        "videos": videos_data,
+        "shorts": shorts_data,
+        "scraped_at": datetime.now().isoformat()
+    }
+
+    file_name = f"{sanitize_filename(channel_info['channel_title'])}_new_data.json"
+    with open(file_name, 'w', encoding='utf-8') as f:
+        json.dump(combined_data, f, indent=4, ensure_ascii=False)
+    logger.info(f"Data saved to {file_name}")
+
+    total_time = time.time() - start_time
+    logger.info(f"Total scraping took {total_time:.2f} seconds")
+    logger.info(f"Final memory usage: {memory_usage_mb():.2f} MB")
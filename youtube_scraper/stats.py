@@ -0,0 +1,167 @@
+import logging
+import re
+
+from . import db
+
+logger = logging.getLogger(__name__)
+
+STATS_COLUMNS = ("item_count", "total_views", "total_likes", "total_duration", "comment_count", "reply_count")
+UNKNOWN_MONTH = "unknown"
+
+def init_stats_tables(cursor):
+    """Create the aggregate tables, returning True if they did not exist yet."""
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'Channel_Stats'")
+    created = cursor.fetchone() is None
+    totals = ',\n'.join(f'            {column} INTEGER NOT NULL DEFAULT 0' for column in STATS_COLUMNS)
+
+    # Channel_Stats table: totals per channel and content type
+    cursor.execute(f'''
+        CREATE TABLE IF NOT EXISTS Channel_Stats (
+            channel_id TEXT,
+            content_type TEXT,
+{totals},
+            PRIMARY KEY (channel_id, content_type)
+        )
+    ''')
+
+    # Channel_Monthly_Stats table: totals per channel, content type and upload month
+    cursor.execute(f'''
+        CREATE TABLE IF NOT EXISTS Channel_Monthly_Stats (
+            channel_id TEXT,
+            content_type TEXT,
+            upload_month TEXT,
+{totals},
+            PRIMARY KEY (channel_id, content_type, upload_month)
+        )
+    ''')
+    return created
+
+def upload_month(upload_date):
+    """Bucket an upload date (YYYY-MM-DD) by month."""
+    if upload_date and re.match(r'^\d{4}-\d{2}', upload_date):
+        return upload_date[:7]
+    return UNKNOWN_MONTH
+
+def stats_contribution(channel_id, views, likes, duration, upload_date, comments, replies):
+    """What one stored video/short adds to the aggregates: (channel_id, month, values)."""
+    return channel_id, upload_month(upload_date), (1, views or 0, likes or 0, duration or 0, comments, replies)
+
+def add_to_stats(cursor, content_type, contribution, sign=1):
+    """Add (or with sign=-1 subtract) a contribution to the channel and monthly totals."""
+    channel_id, month, values = contribution
+    values = tuple(sign * value for value in values)
+    updates = ', '.join(f'{column} = {column} + excluded.{column}' for column in STATS_COLUMNS)
+    cursor.execute(f'''
+        INSERT INTO Channel_Stats (channel_id, content_type, {', '.join(STATS_COLUMNS)})
+        VALUES (?, ?, {', '.join('?' * len(STATS_COLUMNS))})
+        ON CONFLICT(channel_id, content_type) DO UPDATE SET {updates}
+    ''', (channel_id, content_type) + values)
+    cursor.execute(f'''
+        INSERT INTO Channel_Monthly_Stats (channel_id, content_type, upload_month, {', '.join(STATS_COLUMNS)})
+        VALUES (?, ?, ?, {', '.join('?' * len(STATS_COLUMNS))})
+        ON CONFLICT(channel_id, content_type, upload_month) DO UPDATE SET {updates}
+    ''', (channel_id, content_type, month) + values)
+    if sign < 0:
+        cursor.execute('''
+            DELETE FROM Channel_Monthly_Stats
+            WHERE channel_id = ? AND content_type = ? AND upload_month = ? AND item_count = 0
+        ''', (channel_id, content_type, month))
+
+def update_stats(cursor, content_type, old_contribution, new_contribution):
+    """Move a video/short's aggregates from its previous state to its current one."""
+    if old_contribution == new_contribution:
+        return
+    if old_contribution is not None:
+        add_to_stats(cursor, content_type, old_contribution, sign=-1)
+    add_to_stats(cursor, content_type, new_contribution)
+
+def rebuild_stats_tables(cursor):
+    """Recompute every aggregate from the raw Videos/Shorts and comment tables."""
+    cursor.execute('DELETE FROM Channel_Stats')
+    cursor.execute('DELETE FROM Channel_Monthly_Stats')
+    for content_type, table_name, id_field, comments_table, replies_table in (
+        ("videos", "Videos", "video_id", "Videos_Comments", "Videos_Replies"),
+        ("shorts", "Shorts", "short_id", "Shorts_Comments", "Shorts_Replies"),
+    ):
+        cursor.execute(f'''
+            INSERT INTO Channel_Monthly_Stats (channel_id, content_type, upload_month, {', '.join(STATS_COLUMNS)})
+            SELECT
+                item.channel_id, ?,
+                CASE WHEN item.upload_date GLOB '[0-9][0-9][0-9][0-9]-[0-9][0-9]*'
+                     THEN substr(item.upload_date, 1, 7) ELSE ? END AS month,
+                COUNT(*), COALESCE(SUM(item.views), 0), COALESCE(SUM(item.likes), 0),
+                COALESCE(SUM(item.duration), 0), COALESCE(SUM(comments.n), 0), COALESCE(SUM(replies.n), 0)
+            FROM {table_name} AS item
+            LEFT JOIN (
+                SELECT {id_field}, COUNT(*) AS n FROM {comments_table} GROUP BY {id_field}
+            ) AS comments ON comments.{id_field} = item.{id_field}
+            LEFT JOIN (
+                SELECT comment.{id_field}, COUNT(*) AS n
+                FROM {replies_table} AS reply JOIN {comments_table} AS comment ON reply.comment_id = comment.comment_id
+                GROUP BY comment.{id_field}
+            ) AS replies ON replies.{id_field} = item.{id_field}
+            GROUP BY item.channel_id, month
+        ''', (content_type, UNKNOWN_MONTH))
+    cursor.execute(f'''
+        INSERT INTO Channel_Stats (channel_id, content_type, {', '.join(STATS_COLUMNS)})
+        SELECT channel_id, content_type, {', '.join(f'SUM({column})' for column in STATS_COLUMNS)}
+        FROM Channel_Monthly_Stats
+        GROUP BY channel_id, content_type
+    ''')
+
+def rebuild_stats():
+    """Rebuild the aggregate tables from scratch."""
+    conn = db.get_db_connection()
+    cursor = conn.cursor()
+    try:
+        init_stats_tables(cursor)
+        rebuild_stats_tables(cursor)
+        conn.commit()
+        logger.info("Rebuilt channel stats tables")
+    except Exception as e:
+        logger.error(f"Error rebuilding channel stats: {e}")
+    finally:
+        conn.close()
+
+def stats_row_to_dict(row, key_fields):
+    """Convert an aggregate row to a dict with the average views filled in."""
+    stats = dict(zip(key_fields + STATS_COLUMNS, row))
+    stats["average_views"] = stats["total_views"] / stats["item_count"] if stats["item_count"] else 0
+    return stats
+
+def get_channel_stats(channel_id):
+    """Totals for a channel keyed by content type ("videos"/"shorts")."""
+    conn = db.get_db_connection()
+    cursor = conn.cursor()
+    try:
+        cursor.execute(f'''
+            SELECT content_type, {', '.join(STATS_COLUMNS)} FROM Channel_Stats WHERE channel_id = ?
+        ''', (channel_id,))
+        return {row[0]: stats_row_to_dict(row, ("content_type",)) for row in cursor.fetchall()}
+    except Exception as e:
+        logger.error(f"Error loading channel stats from database: {e}")
+        return {}
+    finally:
+        conn.close()
+
+def get_monthly_stats(channel_id, content_type=None):
+    """Per upload month totals for a channel, oldest month first."""
+    conn = db.get_db_connection()
+    cursor = conn.cursor()
+    try:
+        query = f'''
+            SELECT content_type, upload_month, {', '.join(STATS_COLUMNS)}
+            FROM Channel_Monthly_Stats WHERE channel_id = ?
+        '''
+        params = (channel_id,)
+        if content_type:
+            query += ' AND content_type = ?'
+            params += (content_type,)
+        cursor.execute(query + ' ORDER BY upload_month, content_type', params)
+        return [stats_row_to_dict(row, ("content_type", "upload_month")) for row in cursor.fetchall()]
+    except Exception as e:
+        logger.error(f"Error loading monthly stats from database: {e}")
+        return []
+    finally:
+        conn.close()
+
@@ -0,0 +1,53 @@
+import logging
+from datetime import datetime as dt
+
+from .profiling import staged
+
+logger = logging.getLogger(__name__)
+
+def convert_to_int(value):
+    """Convert subscriber/view counts to integer."""
+    if not value:
+        return None
+    value = value.lower().replace(' subscribers', '').replace(' views', '').strip()
+    try:
+        if 'k' in value:
+            return int(float(value.replace('k', '')) * 1000)
+        elif 'm' in value:
+            return int(float(value.replace('m', '')) * 1000000)
+        elif 'b' in value:
+            return int(float(value.replace('b', '')) * 1000000000)
+        return int(value.replace(',', ''))
+    except ValueError:
+        return None
+
+def sanitize_log_message(message):
+    """Replace problematic Unicode characters for logging."""
+    if not isinstance(message, str):
+        message = str(message)
+    return message.encode('ascii', 'replace').decode('ascii')
+
+@staged("parse_timestamp")
+def parse_timestamp(timestamp):
+    """Convert timestamp to ISO format."""
+    logger.debug(f"Parsing timestamp: {timestamp}")
+    try:
+        if isinstance(timestamp, (int, float)):
+            return dt.fromtimestamp(timestamp).isoformat()
+        from dateutil.parser import parse
+        return parse(timestamp, fuzzy=True).isoformat()
+    except Exception as e:
+        logger.warning(f"Failed to parse timestamp {timestamp}: {e}, returning default")
+        return "1970-01-01T00:00:00"
+
+def sanitize_filename(name):
+    """Sanitize filename for saving."""
+    invalid_chars = '<>:"/\\|?*'
+    for char in invalid_chars:
+        name = name.replace(char, '')
+    return name.replace(' ', '_')
+
+def memory_usage_mb():
+    """Resident memory of this process in MB."""
+    import psutil
+    return psutil.Process().memory_info().rss / 1024**2